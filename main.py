@@ -1,7 +1,9 @@
 import pygame
-import math
+from math import cos, sin, radians, atan2, degrees, pi
 import random
+import numpy as np
 from enum import Enum
+from dataclasses import dataclass
 
 # Initialize Pygame
 pygame.init()
@@ -21,6 +23,21 @@ BLUE = (0, 0, 255)
 YELLOW = (255, 255, 0)
 GRAY = (128, 128, 128)
 
+# Steering limits per tick, in radians
+APPROACH_STEERING = radians(3)
+PARKING_STEERING = radians(5)
+TWO_PI = 2 * pi
+
+# How close the car must get to a waypoint, in pixels per axis
+ARRIVAL_TOLERANCE = 5
+# Heading error beyond which the car slows down to turn tightly
+SHARP_TURN = radians(45)
+
+def _steer(angle_diff, gain, limit):
+    """Steer proportionally to the heading error, clamped to +/- limit."""
+    steering = angle_diff * gain
+    return limit if steering > limit else -limit if steering < -limit else steering
+
 class ParkingType(Enum):
     PARALLEL = 1
     PERPENDICULAR = 2
@@ -31,56 +48,81 @@ class CarState(Enum):
     PARKED = 3
     FAILED = 4
 
+@dataclass(slots=True)
+class Spot:
+    rect: pygame.Rect
+    type: ParkingType
+
 class Button:
     def __init__(self, x, y, width, height, text, color):
         self.rect = pygame.Rect(x, y, width, height)
         self.text = text
         self.color = color
         self.is_hovered = False
+        self._font = pygame.font.Font(None, 36)
+        self._text_surface = self._font.render(text, True, BLACK)
+        self._text_rect = self._text_surface.get_rect(center=self.rect.center)
 
     def draw(self, screen):
         pygame.draw.rect(screen, self.color if not self.is_hovered else (*self.color[:3], 200), self.rect)
-        font = pygame.font.Font(None, 36)
-        text_surface = font.render(self.text, True, BLACK)
-        text_rect = text_surface.get_rect(center=self.rect.center)
-        screen.blit(text_surface, text_rect)
-
-    def handle_event(self, event):
-        if event.type == pygame.MOUSEMOTION:
-            self.is_hovered = self.rect.collidepoint(event.pos)
-        elif event.type == pygame.MOUSEBUTTONDOWN:
-            if self.is_hovered:
-                return True
-        return False
+        screen.blit(self._text_surface, self._text_rect)
+
+    def update_hover(self, pos):
+        self.is_hovered = self.rect.collidepoint(pos)
+
+    def is_clicked(self, pos):
+        return self.rect.collidepoint(pos)
 
 class AutonomousCar:
+    # Car body sprites, shared by every car since a new one is made on reset
+    _base_yellow = None
+    _base_green = None
+    _rot_cache_yellow = None
+    _rot_cache_green = None
+
+    @classmethod
+    def _build_sprites(cls):
+        cls._base_yellow = pygame.Surface((CAR_LENGTH, CAR_WIDTH), pygame.SRCALPHA)
+        pygame.draw.rect(cls._base_yellow, YELLOW, (0, 0, CAR_LENGTH, CAR_WIDTH))
+        cls._base_green = pygame.Surface((CAR_LENGTH, CAR_WIDTH), pygame.SRCALPHA)
+        pygame.draw.rect(cls._base_green, GREEN, (0, 0, CAR_LENGTH, CAR_WIDTH))
+        
+        # Pre-rotate the car body once for every whole degree
+        cls._rot_cache_yellow = [pygame.transform.rotate(cls._base_yellow, a) for a in range(360)]
+        cls._rot_cache_green = [pygame.transform.rotate(cls._base_green, a) for a in range(360)]
+
     def __init__(self, x, y):
         self.x = x
         self.y = y
-        self.angle = 0
+        self.angle_rad = 0.0
         self.speed = 0
-        self.steering_angle = 0
+        self.steering_angle = 0  # Radians per tick
         self.state = CarState.SEARCHING
         self.attempt_count = 0
         self.path_points = []
         self.target_spot = None
-        self.failed_spots = []  # Keep track of failed parking spots
+        self.approach_path = None  # Approach waypoint for the current target
+        self.failed_spots = set()  # Keep track of failed parking spots by id()
         self.approach_side = 'right'  # Track which side to approach from
         self.last_route = None  # Store the last attempted route
+        
+        if AutonomousCar._rot_cache_yellow is None:
+            AutonomousCar._build_sprites()
 
     def reset_position(self):
         self.x = 100
         self.y = WINDOW_HEIGHT//2
-        self.angle = 0
+        self.angle_rad = 0.0
         self.path_points = []
         # Alternate approach side after each failure
         self.approach_side = 'left' if self.approach_side == 'right' else 'right'
         
     def move(self):
         if self.state == CarState.SEARCHING or self.state == CarState.PARKING:
-            self.x += math.cos(math.radians(self.angle)) * self.speed
-            self.y -= math.sin(math.radians(self.angle)) * self.speed
-            self.angle += self.steering_angle
+            angle_rad = self.angle_rad
+            self.x += cos(angle_rad) * self.speed
+            self.y -= sin(angle_rad) * self.speed
+            self.angle_rad += self.steering_angle
             self.path_points.append((self.x, self.y))
 
     def draw(self, screen):
@@ -88,13 +130,11 @@ class AutonomousCar:
         if len(self.path_points) > 1:
             pygame.draw.lines(screen, BLUE, False, self.path_points, 2)
 
-        # Draw car body
-        car_surface = pygame.Surface((CAR_LENGTH, CAR_WIDTH), pygame.SRCALPHA)
-        pygame.draw.rect(car_surface, GREEN if self.state == CarState.PARKED else YELLOW, 
-                        (0, 0, CAR_LENGTH, CAR_WIDTH))
+        # Pick the pre-rotated car body
+        rotation_cache = self._rot_cache_green if self.state == CarState.PARKED else self._rot_cache_yellow
+        rotated_surface = rotation_cache[int(degrees(self.angle_rad)) % 360]
         
-        # Rotate and position the car
-        rotated_surface = pygame.transform.rotate(car_surface, self.angle)
+        # Position the car
         screen.blit(rotated_surface, (self.x - rotated_surface.get_width()/2,
                                     self.y - rotated_surface.get_height()/2))
 
@@ -106,6 +146,8 @@ class ParkingSimulation:
         self.car = AutonomousCar(100, WINDOW_HEIGHT//2)
         self.parking_spots = self.generate_parking_spots()
         self.parked_cars = self.generate_parked_cars()
+        self.build_spatial_index()
+        self.build_background()
         
         # Create buttons
         self.start_button = Button(50, 50, 100, 40, "Start", GREEN)
@@ -114,38 +156,45 @@ class ParkingSimulation:
         
         self.running = True
         self.paused = True
+        self.parking_phase = 1
         self.clock = pygame.time.Clock()
+        self._dirty = True  # Frame needs redrawing even if the car is idle
+        
+        # Status labels are only re-rendered when their text changes
+        self._font = pygame.font.Font(None, 36)
+        self._status_key = None
+        self._status_surfaces = None
 
     def generate_parking_spots(self):
         spots = []
         
         # Generate parallel parking spots on the right side
         for i in range(5):  # Increased from 3 to 5
-            spots.append({
-                'rect': pygame.Rect(800, 100 + i * 120, CAR_LENGTH + 20, CAR_WIDTH + 20),
-                'type': ParkingType.PARALLEL
-            })
+            spots.append(Spot(
+                pygame.Rect(800, 100 + i * 120, CAR_LENGTH + 20, CAR_WIDTH + 20),
+                ParkingType.PARALLEL
+            ))
             
         # Generate parallel parking spots on the left side
         for i in range(5):  # Added left side parallel spots
-            spots.append({
-                'rect': pygame.Rect(200, 100 + i * 120, CAR_LENGTH + 20, CAR_WIDTH + 20),
-                'type': ParkingType.PARALLEL
-            })
+            spots.append(Spot(
+                pygame.Rect(200, 100 + i * 120, CAR_LENGTH + 20, CAR_WIDTH + 20),
+                ParkingType.PARALLEL
+            ))
         
         # Generate perpendicular parking spots at the bottom
         for i in range(8):  # Increased from 4 to 8
-            spots.append({
-                'rect': pygame.Rect(300 + i * 80, 600, CAR_WIDTH + 20, CAR_LENGTH + 20),
-                'type': ParkingType.PERPENDICULAR
-            })
+            spots.append(Spot(
+                pygame.Rect(300 + i * 80, 600, CAR_WIDTH + 20, CAR_LENGTH + 20),
+                ParkingType.PERPENDICULAR
+            ))
             
         # Generate perpendicular parking spots at the top
         for i in range(8):  # Added top perpendicular spots
-            spots.append({
-                'rect': pygame.Rect(300 + i * 80, 100, CAR_WIDTH + 20, CAR_LENGTH + 20),
-                'type': ParkingType.PERPENDICULAR
-            })
+            spots.append(Spot(
+                pygame.Rect(300 + i * 80, 100, CAR_WIDTH + 20, CAR_LENGTH + 20),
+                ParkingType.PERPENDICULAR
+            ))
             
         return spots
 
@@ -163,95 +212,152 @@ class ParkingSimulation:
         occupied_spots = random.sample(available_spots, num_spots_to_occupy)
         
         for spot in occupied_spots:
-            parked_cars.append({
-                'rect': spot['rect'],
-                'type': spot['type']
-            })
+            parked_cars.append(Spot(spot.rect, spot.type))
             
         return parked_cars
 
+    def build_spatial_index(self):
+        # Parked cars copy their spot's rect, so occupancy is an exact rect lookup
+        self._occupied_rects = {tuple(car.rect) for car in self.parked_cars}
+        
+        # Spot centers never move, so keep them as flat arrays for distance queries
+        self._spot_cx = np.array([spot.rect.centerx for spot in self.parking_spots], dtype=float)
+        self._spot_cy = np.array([spot.rect.centery for spot in self.parking_spots], dtype=float)
+        self.occupied_mask = np.array([self.is_spot_occupied(spot) for spot in self.parking_spots], dtype=bool)
+        self._h_cache = {}  # Squared spot distances keyed by query position
+        
+        # Parked car edges as flat arrays so collision checks are a single vector compare
+        car_rects = np.array([tuple(car.rect) for car in self.parked_cars], dtype=float).reshape(-1, 4)
+        self._pc_x1 = car_rects[:, 0]
+        self._pc_y1 = car_rects[:, 1]
+        self._pc_x2 = car_rects[:, 0] + car_rects[:, 2]
+        self._pc_y2 = car_rects[:, 1] + car_rects[:, 3]
+
+    def build_background(self):
+        # Spots and parked cars only change on reset, so render them once
+        self._bg = self.screen.copy()
+        self._bg.fill(WHITE)
+        
+        # Draw parking spots
+        for spot in self.parking_spots:
+            pygame.draw.rect(self._bg, GREEN, spot.rect, 2)
+        
+        # Draw parked cars (obstacles)
+        for car in self.parked_cars:
+            pygame.draw.rect(self._bg, RED, car.rect)
+
+    def is_spot_occupied(self, spot):
+        return tuple(spot.rect) in self._occupied_rects
+
+    def spot_distances(self, x, y):
+        # The car always searches from its reset position, so retries hit the cache
+        d2 = self._h_cache.get((x, y))
+        if d2 is None:
+            d2 = (self._spot_cx - x)**2 + (self._spot_cy - y)**2
+            # Occupied spots sort last
+            d2 = np.where(self.occupied_mask, np.inf, d2)
+            self._h_cache[(x, y)] = d2
+        return d2
+
     def find_nearest_parking_spot(self):
         available_spots = []
+        d2 = self.spot_distances(self.car.x, self.car.y)
         
-        for spot in self.parking_spots:
-            # Skip if spot is occupied or was previously failed
-            if any(car['rect'] == spot['rect'] for car in self.parked_cars) or \
-               spot in self.car.failed_spots:
+        # First attempt only needs the nearest free spot, a single pass without sorting
+        if self.car.attempt_count == 0 and not self.car.failed_spots and d2.size:
+            index = int(np.argmin(d2))
+            return self.parking_spots[index] if d2[index] != np.inf else None
+        
+        # Visit spots nearest first
+        for index in np.argsort(d2, kind='stable'):
+            # Stop at occupied spots, skip previously failed ones
+            if d2[index] == np.inf:
+                break
+            spot = self.parking_spots[index]
+            if id(spot) in self.car.failed_spots:
                 continue
             
-            distance = math.sqrt((self.car.x - spot['rect'].centerx)**2 + 
-                               (self.car.y - spot['rect'].centery)**2)
-            available_spots.append((spot, distance))
+            available_spots.append(spot)
+            
+            # Choose a different spot based on attempt count
+            if len(available_spots) > self.car.attempt_count:
+                break
         
         if not available_spots:
             return None
-            
-        # Sort spots by distance
-        available_spots.sort(key=lambda x: x[1])
         
-        # Choose a different spot based on attempt count
-        spot_index = min(self.car.attempt_count, len(available_spots) - 1)
-        return available_spots[spot_index][0]
+        return available_spots[-1]
 
     def check_collision(self):
-        car_rect = pygame.Rect(self.car.x - CAR_WIDTH/2, self.car.y - CAR_LENGTH/2,
-                              CAR_WIDTH, CAR_LENGTH)
-        
-        # Check collision with parked cars
-        for parked_car in self.parked_cars:
-            if car_rect.colliderect(parked_car['rect']):
-                return True
-        
         # Check collision with boundaries
-        if (self.car.x < 0 or self.car.x > WINDOW_WIDTH or 
-            self.car.y < 0 or self.car.y > WINDOW_HEIGHT):
+        if not (0 <= self.car.x <= WINDOW_WIDTH and 0 <= self.car.y <= WINDOW_HEIGHT):
             return True
-            
-        return False
+        
+        # Car bounds, truncated to whole pixels the same way pygame.Rect does
+        cx1 = int(self.car.x - CAR_WIDTH/2)
+        cy1 = int(self.car.y - CAR_LENGTH/2)
+        cx2 = cx1 + CAR_WIDTH
+        cy2 = cy1 + CAR_LENGTH
+        
+        # Check collision with all parked cars at once
+        overlap = (cx2 > self._pc_x1) & (cx1 < self._pc_x2) & (cy2 > self._pc_y1) & (cy1 < self._pc_y2)
+        return bool(overlap.any())
 
     def reset_simulation(self):
         self.car = AutonomousCar(100, WINDOW_HEIGHT//2)
         self.paused = True
+        self.parking_phase = 1
+        self._dirty = True
         self.parking_spots = self.generate_parking_spots()
         self.parked_cars = self.generate_parked_cars()
+        self.build_spatial_index()
+        self.build_background()
 
     def generate_approach_path(self, target_spot):
         """Generate different approach paths based on parking type and previous failures"""
-        if target_spot['type'] == ParkingType.PARALLEL:
+        if target_spot.type == ParkingType.PARALLEL:
             # For parallel parking, generate different approach angles
             if self.car.approach_side == 'right':
-                return {'approach_x': target_spot['rect'].x - 100,
-                       'approach_y': target_spot['rect'].y - 50,
+                return {'approach_x': target_spot.rect.x - 100,
+                       'approach_y': target_spot.rect.y - 50,
                        'final_angle': 0}
             else:
-                return {'approach_x': target_spot['rect'].x - 100,
-                       'approach_y': target_spot['rect'].y + 50,
+                return {'approach_x': target_spot.rect.x - 100,
+                       'approach_y': target_spot.rect.y + 50,
                        'final_angle': 0}
         else:
             # For perpendicular parking, try different approach distances
             offset = 150 if self.car.attempt_count % 2 == 0 else 200
-            return {'approach_x': target_spot['rect'].x - offset,
-                   'approach_y': target_spot['rect'].y,
+            return {'approach_x': target_spot.rect.x - offset,
+                   'approach_y': target_spot.rect.y,
                    'final_angle': 90}
 
+    def steer_towards(self, dx, dy, speed, gain, limit):
+        """Head the car towards an offset, crawling through sharp turns so it cannot orbit the waypoint."""
+        angle_to_target = atan2(-dy, dx)
+        # Signed heading error in [-pi, pi) so the car can steer both ways
+        angle_diff = (angle_to_target - self.car.angle_rad + pi) % TWO_PI - pi
+        
+        # At full speed the turning circle is wider than the arrival box, so a
+        # waypoint beside the car would be circled forever. Slow down until the
+        # turning radius (speed / limit) is half the arrival tolerance.
+        if abs(angle_diff) > SHARP_TURN:
+            speed = min(speed, limit * ARRIVAL_TOLERANCE / 2)
+        
+        self.car.speed = speed
+        self.car.steering_angle = _steer(angle_diff, gain, limit)
+
     def parallel_parking_movement(self):
-        target = self.car.target_spot['rect']
-        approach_path = self.generate_approach_path(self.car.target_spot)
+        target = self.car.target_spot.rect
+        approach_path = self.car.approach_path
         
         # Phase 1: Approach the parking spot
-        if not hasattr(self, 'parking_phase'):
-            self.parking_phase = 1
-            
         if self.parking_phase == 1:
             dx = approach_path['approach_x'] - self.car.x
             dy = approach_path['approach_y'] - self.car.y
             
-            if abs(dx) > 5 or abs(dy) > 5:
-                angle_to_target = math.degrees(math.atan2(-dy, dx))
-                angle_diff = (angle_to_target - self.car.angle) % 360
-                
-                self.car.speed = 2
-                self.car.steering_angle = min(max(angle_diff * 0.1, -3), 3)
+            if abs(dx) > ARRIVAL_TOLERANCE or abs(dy) > ARRIVAL_TOLERANCE:
+                self.steer_towards(dx, dy, 2, 0.1, APPROACH_STEERING)
             else:
                 self.parking_phase = 2
                 
@@ -260,13 +366,9 @@ class ParkingSimulation:
             dx = target.centerx - self.car.x
             dy = target.centery - self.car.y
             
-            if abs(dx) > 5 or abs(dy) > 5:
+            if abs(dx) > ARRIVAL_TOLERANCE or abs(dy) > ARRIVAL_TOLERANCE:
                 # Add more complex parking logic here
-                angle_to_target = math.degrees(math.atan2(-dy, dx))
-                angle_diff = (angle_to_target - self.car.angle) % 360
-                
-                self.car.speed = 1  # Slower speed during actual parking
-                self.car.steering_angle = min(max(angle_diff * 0.15, -5), 5)
+                self.steer_towards(dx, dy, 1, 0.15, PARKING_STEERING)
             else:
                 self.car.state = CarState.PARKED
                 self.car.speed = 0
@@ -274,23 +376,16 @@ class ParkingSimulation:
                 self.parking_phase = 1  # Reset for next attempt
 
     def perpendicular_parking_movement(self):
-        target = self.car.target_spot['rect']
-        approach_path = self.generate_approach_path(self.car.target_spot)
+        target = self.car.target_spot.rect
+        approach_path = self.car.approach_path
         
-        if not hasattr(self, 'parking_phase'):
-            self.parking_phase = 1
-            
         if self.parking_phase == 1:
             # Approach phase
             dx = approach_path['approach_x'] - self.car.x
             dy = approach_path['approach_y'] - self.car.y
             
-            if abs(dx) > 5 or abs(dy) > 5:
-                angle_to_target = math.degrees(math.atan2(-dy, dx))
-                angle_diff = (angle_to_target - self.car.angle) % 360
-                
-                self.car.speed = 2
-                self.car.steering_angle = min(max(angle_diff * 0.1, -3), 3)
+            if abs(dx) > ARRIVAL_TOLERANCE or abs(dy) > ARRIVAL_TOLERANCE:
+                self.steer_towards(dx, dy, 2, 0.1, APPROACH_STEERING)
             else:
                 self.parking_phase = 2
                 
@@ -299,12 +394,8 @@ class ParkingSimulation:
             dx = target.centerx - self.car.x
             dy = target.centery - self.car.y
             
-            if abs(dx) > 5 or abs(dy) > 5:
-                angle_to_target = math.degrees(math.atan2(-dy, dx))
-                angle_diff = (angle_to_target - self.car.angle) % 360
-                
-                self.car.speed = 1
-                self.car.steering_angle = min(max(angle_diff * 0.15, -5), 5)
+            if abs(dx) > ARRIVAL_TOLERANCE or abs(dy) > ARRIVAL_TOLERANCE:
+                self.steer_towards(dx, dy, 1, 0.15, PARKING_STEERING)
             else:
                 self.car.state = CarState.PARKED
                 self.car.speed = 0
@@ -313,35 +404,55 @@ class ParkingSimulation:
 
     def run(self):
         while self.running:
+            # Only the latest mouse position and click of the frame matter
+            motion = None
+            click = None
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     self.running = False
-                
-                # Handle button events
-                if self.start_button.handle_event(event):
+                elif event.type == pygame.MOUSEMOTION:
+                    motion = event.pos
+                elif event.type == pygame.MOUSEBUTTONDOWN:
+                    click = event.pos
+                elif event.type == pygame.VIDEOEXPOSE:
+                    self._dirty = True
+            
+            # Handle button events
+            if motion is not None or click is not None:
+                self._dirty = True
+            
+            if motion is not None:
+                self.start_button.update_hover(motion)
+                self.pause_button.update_hover(motion)
+                self.reset_button.update_hover(motion)
+            
+            if click is not None:
+                if self.start_button.is_clicked(click):
                     self.paused = False
-                elif self.pause_button.handle_event(event):
+                elif self.pause_button.is_clicked(click):
                     self.paused = True
-                elif self.reset_button.handle_event(event):
+                elif self.reset_button.is_clicked(click):
                     self.reset_simulation()
 
+            previous_state = self.car.state
             if not self.paused:
                 if self.car.state == CarState.SEARCHING:
                     # Find nearest parking spot
                     target_spot = self.find_nearest_parking_spot()
                     if target_spot:
                         self.car.target_spot = target_spot
+                        self.car.approach_path = self.generate_approach_path(target_spot)
                         self.car.state = CarState.PARKING
                     elif self.car.attempt_count >= 3:
                         self.car.state = CarState.FAILED
                     else:
                         self.car.attempt_count += 1
                         if self.car.target_spot:
-                            self.car.failed_spots.append(self.car.target_spot)
+                            self.car.failed_spots.add(id(self.car.target_spot))
                         self.car.reset_position()
 
                 elif self.car.state == CarState.PARKING:
-                    if self.car.target_spot['type'] == ParkingType.PARALLEL:
+                    if self.car.target_spot.type == ParkingType.PARALLEL:
                         self.parallel_parking_movement()
                     else:
                         self.perpendicular_parking_movement()
@@ -352,30 +463,29 @@ class ParkingSimulation:
                 # Check for collisions
                 if self.check_collision():
                     if self.car.target_spot:
-                        self.car.failed_spots.append(self.car.target_spot)
+                        self.car.failed_spots.add(id(self.car.target_spot))
                     self.car.state = CarState.SEARCHING
                     self.car.attempt_count += 1
                     self.car.reset_position()
-                    if hasattr(self, 'parking_phase'):
-                        self.parking_phase = 1
+                    self.parking_phase = 1
 
+            if self.car.state != previous_state:
+                self._dirty = True
+            
+            # Only a moving car needs a redraw every frame
+            active = not self.paused and self.car.state in (CarState.SEARCHING, CarState.PARKING)
+            
             # Draw everything
-            self.draw()
+            if self._dirty or active:
+                self.draw()
+                self._dirty = False
             
-            # Cap the frame rate
-            self.clock.tick(60)
+            # Cap the frame rate, idling at a lower rate while nothing moves
+            self.clock.tick(60 if active else 10)
 
     def draw(self):
-        # Clear screen
-        self.screen.fill(WHITE)
-        
-        # Draw parking spots
-        for spot in self.parking_spots:
-            pygame.draw.rect(self.screen, GREEN, spot['rect'], 2)
-        
-        # Draw parked cars (obstacles)
-        for car in self.parked_cars:
-            pygame.draw.rect(self.screen, RED, car['rect'])
+        # Draw the static scene
+        self.screen.blit(self._bg, (0, 0))
         
         # Draw autonomous car
         self.car.draw(self.screen)
@@ -386,13 +496,15 @@ class ParkingSimulation:
         self.reset_button.draw(self.screen)
         
         # Draw status
-        font = pygame.font.Font(None, 36)
-        status_text = f"Status: {self.car.state.name}"
-        attempts_text = f"Attempts: {self.car.attempt_count}/3"
-        
-        status_surface = font.render(status_text, True, BLACK)
-        attempts_surface = font.render(attempts_text, True, BLACK)
+        status_key = (self.car.state.name, self.car.attempt_count)
+        if status_key != self._status_key:
+            status_text = f"Status: {self.car.state.name}"
+            attempts_text = f"Attempts: {self.car.attempt_count}/3"
+            self._status_surfaces = (self._font.render(status_text, True, BLACK),
+                                     self._font.render(attempts_text, True, BLACK))
+            self._status_key = status_key
         
+        status_surface, attempts_surface = self._status_surfaces
         self.screen.blit(status_surface, (50, 100))
         self.screen.blit(attempts_surface, (50, 140))
         
@@ -1,9 +1,16 @@
 import pygame
 import random
 import numpy as np
+from dataclasses import dataclass
 from vehicle import Vehicle
 from pathfinding import PathFinder
-from utils import distance
+from quadtree import QuadTree
+
+@dataclass(slots=True)
+class Spot:
+    rect: pygame.Rect
+    type: str  # "parallel" or "perpendicular"
+    orientation: str  # "horizontal" or "vertical"
 
 class ParkingSimulation:
     def __init__(self, width, height):
@@ -16,14 +23,14 @@ class ParkingSimulation:
         start_y = height // 2
         self.vehicle = Vehicle(start_x, start_y, 0)
         
+        # Pathfinding
+        self.pathfinder = PathFinder(width, height)
+        
         # Setup environment
         self.obstacles = []  # Red cars
         self.parking_spots = []  # Green rectangles
         self.create_environment()
         
-        # Pathfinding
-        self.pathfinder = PathFinder(width, height)
-        
         # Simulation state
         self.current_attempt = 0
         self.max_attempts = 3
@@ -57,11 +64,7 @@ class ParkingSimulation:
                 else:
                     # Create an empty parking spot
                     spot_rect = pygame.Rect(x, y_pos, spot_width, spot_height)
-                    self.parking_spots.append({
-                        "rect": spot_rect,
-                        "type": "parallel",
-                        "orientation": "horizontal" 
-                    })
+                    self.parking_spots.append(Spot(spot_rect, "parallel", "horizontal"))
         
         # Create some perpendicular parking spots (vertical)
         perp_count = 4
@@ -82,11 +85,25 @@ class ParkingSimulation:
                 else:
                     # Create an empty parking spot
                     spot_rect = pygame.Rect(x_pos, y, spot_width, spot_height)
-                    self.parking_spots.append({
-                        "rect": spot_rect,
-                        "type": "perpendicular",
-                        "orientation": "vertical"
-                    })
+                    self.parking_spots.append(Spot(spot_rect, "perpendicular", "vertical"))
+        
+        # Index the free spots for nearest-spot queries
+        self.spot_tree = QuadTree(pygame.Rect(0, 0, self.width, self.height))
+        for spot in self.parking_spots:
+            self.spot_tree.insert(spot.rect, spot)
+        
+        # Nothing moves until the next reset, so cached paths stay valid until then
+        self.obstacle_fingerprint = tuple(sorted(
+            (rect.x, rect.y, rect.w, rect.h)
+            for rect in self.obstacles + [spot.rect for spot in self.parking_spots]
+        ))
+        self._path_cache = {}
+        self._entry_points = {}
+        
+        # Rasterize the obstacles once; other spots are overlaid per target spot
+        self.static_grid = self.pathfinder.create_obstacle_grid(self.obstacles)
+        self._grid_spot = None
+        self._grid = None
     
     def reset(self):
         """Reset the simulation."""
@@ -107,20 +124,7 @@ class ParkingSimulation:
         vehicle_pos = (self.vehicle.x, self.vehicle.y)
         
         # Find the nearest parking spot
-        nearest_spot = None
-        min_distance = float('inf')
-        
-        for spot in self.parking_spots:
-            # Calculate distance to the spot
-            spot_center = (
-                spot["rect"].centerx,
-                spot["rect"].centery
-            )
-            dist = distance(vehicle_pos, spot_center)
-            
-            if dist < min_distance:
-                min_distance = dist
-                nearest_spot = spot
+        nearest_spot = self.spot_tree.nearest(vehicle_pos)
         
         if nearest_spot:
             self.active_spot = nearest_spot
@@ -129,20 +133,8 @@ class ParkingSimulation:
             # Calculate entry point based on spot type
             entry_point = self.calculate_entry_point(nearest_spot)
             
-            # Generate a path to the entry point
-            obstacles = self.obstacles.copy()
-            
-            # Add all other parking spots as obstacles for pathfinding
-            for spot in self.parking_spots:
-                if spot != nearest_spot:
-                    obstacles.append(spot["rect"])
-            
             # Find path to entry point
-            path = self.pathfinder.find_path(
-                (self.vehicle.x, self.vehicle.y),
-                entry_point,
-                obstacles
-            )
+            path = self.find_path_cached(vehicle_pos, entry_point, nearest_spot)
             
             if path:
                 # Add parking maneuver to the path
@@ -155,11 +147,43 @@ class ParkingSimulation:
         self.status = "No valid parking spots found"
         return False
     
+    def find_path_cached(self, start, goal, target_spot):
+        """Find a path to goal, reusing earlier results for the same layout."""
+        # Quantize to 10 pixels, finer than the pathfinding grid, so hits return identical paths
+        key = (
+            (int(start[0]) // 10, int(start[1]) // 10),
+            (int(goal[0]) // 10, int(goal[1]) // 10),
+            id(target_spot),
+            self.obstacle_fingerprint
+        )
+        path = self._path_cache.get(key)
+        if path is None:
+            path = self.pathfinder.find_path(start, goal, self.get_obstacle_grid(target_spot))
+            self._path_cache[key] = path
+        return path
+    
+    def get_obstacle_grid(self, target_spot):
+        """Get the obstacle grid with all spots except target_spot blocked."""
+        if self._grid is None or self._grid_spot is not target_spot:
+            # Add all other parking spots as obstacles for pathfinding
+            other_spots = [spot.rect for spot in self.parking_spots if spot is not target_spot]
+            overlay = self.pathfinder.create_obstacle_grid(other_spots)
+            self._grid = self.static_grid | overlay
+            self._grid_spot = target_spot
+        return self._grid
+    
     def calculate_entry_point(self, spot):
         """Calculate the entry point for a parking maneuver."""
-        rect = spot["rect"]
-        spot_type = spot["type"]
-        orientation = spot["orientation"]
+        entry_point = self._entry_points.get(id(spot))
+        if entry_point is None:
+            entry_point = self._entry_points[id(spot)] = self._compute_entry_point(spot)
+        return entry_point
+    
+    def _compute_entry_point(self, spot):
+        """Compute the entry point for a parking maneuver from the spot layout."""
+        rect = spot.rect
+        spot_type = spot.type
+        orientation = spot.orientation
         
         if spot_type == "parallel":
             if orientation == "horizontal":
@@ -181,9 +205,9 @@ class ParkingSimulation:
     
     def add_parking_maneuver(self, entry_point, spot):
         """Add parking maneuver waypoints to the path."""
-        rect = spot["rect"]
-        spot_type = spot["type"]
-        orientation = spot["orientation"]
+        rect = spot.rect
+        spot_type = spot.type
+        orientation = spot.orientation
         
         # Start with the entry point
         path = [entry_point]
@@ -239,7 +263,7 @@ class ParkingSimulation:
         """Draw the simulation on the screen."""
         # Draw parking spots
         for spot in self.parking_spots:
-            pygame.draw.rect(screen, (0, 200, 0), spot["rect"], 2)  # Green rectangles
+            pygame.draw.rect(screen, (0, 200, 0), spot.rect, 2)  # Green rectangles
         
         # Draw obstacles (red cars)
         for obstacle in self.obstacles:
@@ -247,7 +271,7 @@ class ParkingSimulation:
         
         # Draw active spot with a different color if exists
         if self.active_spot:
-            pygame.draw.rect(screen, (0, 255, 0), self.active_spot["rect"], 3)  # Brighter green
+            pygame.draw.rect(screen, (0, 255, 0), self.active_spot.rect, 3)  # Brighter green
         
         # Draw vehicle
         self.vehicle.draw(screen)
@@ -1,7 +1,144 @@
 import pygame
 import numpy as np
 import heapq
-from utils import distance
+from utils import njit, NUMBA_AVAILABLE
+
+# Neighbor offsets in the order A* expands them
+NEIGHBOR_DX = np.array([0, 1, 0, -1, 1, -1, 1, -1])
+NEIGHBOR_DY = np.array([1, 0, -1, 0, 1, 1, -1, -1])
+
+@njit(cache=True)
+def _heap_less(f_a, key_a, f_b, key_b):
+    """Order heap entries by f score, then by grid position like heapq tuples."""
+    return f_a < f_b or (f_a == f_b and key_a < key_b)
+
+@njit(cache=True)
+def _heap_sift_up(heap_f, heap_key, heap_cell, pos, i, f, key, cell):
+    """Move an entry up from slot i until the heap order holds, keeping pos in sync."""
+    while i > 0:
+        parent = (i - 1) >> 1
+        if not _heap_less(f, key, heap_f[parent], heap_key[parent]):
+            break
+        heap_f[i] = heap_f[parent]
+        heap_key[i] = heap_key[parent]
+        heap_cell[i] = heap_cell[parent]
+        pos[heap_cell[i]] = i
+        i = parent
+    
+    heap_f[i] = f
+    heap_key[i] = key
+    heap_cell[i] = cell
+    pos[cell] = i
+
+@njit(cache=True)
+def _heap_push(heap_f, heap_key, heap_cell, pos, size, f, key, cell):
+    """Push a cell onto the binary min-heap and return the new heap size."""
+    _heap_sift_up(heap_f, heap_key, heap_cell, pos, size, f, key, cell)
+    return size + 1
+
+@njit(cache=True)
+def _heap_decrease(heap_f, heap_key, heap_cell, pos, cell, f):
+    """Lower the f score of a cell already in the heap."""
+    i = pos[cell]
+    _heap_sift_up(heap_f, heap_key, heap_cell, pos, i, f, heap_key[i], cell)
+
+@njit(cache=True)
+def _heap_pop(heap_f, heap_key, heap_cell, pos, size):
+    """Pop the lowest cell off the binary min-heap and return it with the new heap size."""
+    top = heap_cell[0]
+    pos[top] = -1
+    size -= 1
+    if size == 0:
+        return top, size
+    
+    # Sift the last entry down from the root
+    f = heap_f[size]
+    key = heap_key[size]
+    cell = heap_cell[size]
+    i = 0
+    while True:
+        child = 2 * i + 1
+        if child >= size:
+            break
+        if child + 1 < size and _heap_less(heap_f[child + 1], heap_key[child + 1], heap_f[child], heap_key[child]):
+            child += 1
+        if not _heap_less(heap_f[child], heap_key[child], f, key):
+            break
+        heap_f[i] = heap_f[child]
+        heap_key[i] = heap_key[child]
+        heap_cell[i] = heap_cell[child]
+        pos[heap_cell[i]] = i
+        i = child
+    
+    heap_f[i] = f
+    heap_key[i] = key
+    heap_cell[i] = cell
+    pos[cell] = i
+    return top, size
+
+@njit(cache=True)
+def _astar_numba(obstacle_grid, sx, sy, ex, ey, width, height):
+    """Run A* on the obstacle grid and return (found, came_from) with cells indexed y * width + x."""
+    cell_count = width * height
+    came_from = np.full(cell_count, -1, dtype=np.int32)
+    g_score = np.full(cell_count, np.inf)
+    h_cache = np.full(cell_count, -1.0)  # Heuristic per cell, filled on first touch
+    
+    # Open set as an indexed binary heap; keys x * height + y break ties like (x, y) tuples
+    heap_f = np.empty(cell_count, dtype=np.float64)
+    heap_key = np.empty(cell_count, dtype=np.int32)
+    heap_cell = np.empty(cell_count, dtype=np.int32)
+    pos = np.full(cell_count, -1, dtype=np.int32)  # Heap slot of each open cell, -1 if not open
+    
+    start = sy * width + sx
+    end = ey * width + ex
+    g_score[start] = 0.0
+    size = _heap_push(heap_f, heap_key, heap_cell, pos, 0, 0.0, sx * height + sy, start)
+    
+    while size > 0:
+        current, size = _heap_pop(heap_f, heap_key, heap_cell, pos, size)
+        
+        if current == end:
+            return True, came_from
+        
+        cx = current % width
+        cy = current // width
+        for d in range(8):
+            dx = NEIGHBOR_DX[d]
+            dy = NEIGHBOR_DY[d]
+            nx = cx + dx
+            ny = cy + dy
+            
+            # Skip if outside grid or in obstacle
+            if nx < 0 or nx >= width or ny < 0 or ny >= height or obstacle_grid[ny, nx]:
+                continue
+            
+            # Calculate cost (diagonal movement costs more)
+            if dx != 0 and dy != 0:
+                tentative_g_score = g_score[current] + 1.414  # sqrt(2)
+            else:
+                tentative_g_score = g_score[current] + 1.0
+            
+            neighbor = ny * width + nx
+            if tentative_g_score < g_score[neighbor]:
+                # This path to neighbor is better than any previous one
+                came_from[neighbor] = current
+                g_score[neighbor] = tentative_g_score
+                
+                h = h_cache[neighbor]
+                if h < 0.0:
+                    hx = abs(nx - ex)
+                    hy = abs(ny - ey)
+                    h = max(hx, hy) + 0.414 * min(hx, hy)
+                    h_cache[neighbor] = h
+                f = tentative_g_score + h
+                
+                if pos[neighbor] == -1:
+                    size = _heap_push(heap_f, heap_key, heap_cell, pos, size, f, nx * height + ny, neighbor)
+                else:
+                    _heap_decrease(heap_f, heap_key, heap_cell, pos, neighbor, f)
+    
+    return False, came_from
 
 class PathFinder:
     def __init__(self, width, height, grid_size=20):
@@ -12,8 +149,8 @@ class PathFinder:
         self.grid_width = width // grid_size
         self.grid_height = height // grid_size
     
-    def find_path(self, start, end, obstacles):
-        """Find a path from start to end avoiding obstacles using A* algorithm."""
+    def find_path(self, start, end, obstacle_grid):
+        """Find a path from start to end avoiding a prebuilt obstacle grid using A* algorithm."""
         # Convert start and end to grid coordinates
         start_grid = (int(start[0] / self.grid_size), int(start[1] / self.grid_size))
         end_grid = (int(end[0] / self.grid_size), int(end[1] / self.grid_size))
@@ -22,13 +159,41 @@ class PathFinder:
         if not self._is_valid_position(start_grid) or not self._is_valid_position(end_grid):
             return []
         
-        # Create an obstacle grid
-        obstacle_grid = self._create_obstacle_grid(obstacles)
-        
         # Check if start or end points are in obstacles
-        if obstacle_grid[start_grid[1]][start_grid[0]] or obstacle_grid[end_grid[1]][end_grid[0]]:
+        if obstacle_grid[start_grid[1], start_grid[0]] or obstacle_grid[end_grid[1], end_grid[0]]:
+            return []
+        
+        if NUMBA_AVAILABLE:
+            path = self._find_grid_path_numba(start_grid, end_grid, obstacle_grid)
+        else:
+            path = self._find_grid_path(start_grid, end_grid, obstacle_grid)
+        
+        # Convert back to world coordinates
+        return [(x * self.grid_size + self.grid_size // 2, 
+                 y * self.grid_size + self.grid_size // 2) for x, y in path]
+    
+    def _find_grid_path_numba(self, start_grid, end_grid, obstacle_grid):
+        """Find a grid path with the compiled A* kernel."""
+        found, came_from = _astar_numba(np.ascontiguousarray(obstacle_grid, dtype=np.uint8),
+                                        start_grid[0], start_grid[1], end_grid[0], end_grid[1],
+                                        self.grid_width, self.grid_height)
+        if not found:
             return []
         
+        # Reconstruct path
+        current = end_grid[1] * self.grid_width + end_grid[0]
+        total_path = [end_grid]
+        while came_from[current] != -1:
+            current = int(came_from[current])
+            total_path.append((current % self.grid_width, current // self.grid_width))
+        
+        return list(reversed(total_path))
+    
+    def _find_grid_path(self, start_grid, end_grid, obstacle_grid):
+        """Find a grid path with the pure Python A* used when Numba is unavailable."""
+        # Nested lists are cheaper than ndarray element access in the loop below
+        obstacle_grid = obstacle_grid.tolist()
+        
         # A* algorithm
         open_set = []  # Priority queue
         heapq.heappush(open_set, (0, start_grid))  # (priority, position)
@@ -36,19 +201,20 @@ class PathFinder:
         came_from = {}  # To reconstruct the path
         g_score = {start_grid: 0}  # Cost from start
         f_score = {start_grid: self._heuristic(start_grid, end_grid)}  # Estimated total cost
+        h_cache = {}  # Heuristic per cell, filled on first touch
         
-        open_set_hash = {start_grid}  # For quick membership check
+        open_set_priority = {start_grid: 0}  # Current priority of each open position
         
         while open_set:
-            current = heapq.heappop(open_set)[1]
-            open_set_hash.remove(current)
+            priority, current = heapq.heappop(open_set)
+            # Skip entries superseded by a lower priority or already expanded
+            if open_set_priority.get(current) != priority:
+                continue
+            del open_set_priority[current]
             
             if current == end_grid:
                 # Reconstruct path
-                path = self._reconstruct_path(came_from, current)
-                # Convert back to world coordinates
-                return [(x * self.grid_size + self.grid_size // 2, 
-                         y * self.grid_size + self.grid_size // 2) for x, y in path]
+                return self._reconstruct_path(came_from, current)
             
             # Check neighbors
             for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0), (1, 1), (-1, 1), (1, -1), (-1, -1)]:
@@ -68,11 +234,14 @@ class PathFinder:
                     # This path to neighbor is better than any previous one
                     came_from[neighbor] = current
                     g_score[neighbor] = tentative_g_score
-                    f_score[neighbor] = tentative_g_score + self._heuristic(neighbor, end_grid)
+                    h = h_cache.get(neighbor)
+                    if h is None:
+                        h = h_cache[neighbor] = self._heuristic(neighbor, end_grid)
+                    f_score[neighbor] = tentative_g_score + h
                     
-                    if neighbor not in open_set_hash:
-                        heapq.heappush(open_set, (f_score[neighbor], neighbor))
-                        open_set_hash.add(neighbor)
+                    # heapq has no decrease-key, so push again and let the old entry go stale
+                    open_set_priority[neighbor] = f_score[neighbor]
+                    heapq.heappush(open_set, (f_score[neighbor], neighbor))
         
         # No path found
         return []
@@ -82,9 +251,11 @@ class PathFinder:
         x, y = pos
         return 0 <= x < self.grid_width and 0 <= y < self.grid_height
     
-    def _create_obstacle_grid(self, obstacles):
+    def create_obstacle_grid(self, obstacles):
         """Create a grid marking obstacle locations."""
-        grid = [[False for _ in range(self.grid_width)] for _ in range(self.grid_height)]
+        grid = np.zeros((self.grid_height, self.grid_width), dtype=np.uint8)
+        
+        margin = 1  # Safety margin in grid cells
         
         for obstacle in obstacles:
             # Convert obstacle rect to grid coordinates
@@ -93,12 +264,10 @@ class PathFinder:
             top = max(0, obstacle.top // self.grid_size)
             bottom = min(self.grid_height - 1, obstacle.bottom // self.grid_size)
             
-            # Mark cells as obstacles with a safety margin
-            margin = 1  # Safety margin in grid cells
-            
-            for y in range(max(0, top - margin), min(self.grid_height, bottom + margin + 1)):
-                for x in range(max(0, left - margin), min(self.grid_width, right + margin + 1)):
-                    grid[y][x] = True
+            # Mark cells as obstacles with a safety margin in one slice assignment,
+            # clamping the ends so rects fully off the grid don't wrap around
+            grid[max(0, top - margin):max(0, bottom + margin + 1),
+                 max(0, left - margin):max(0, right + margin + 1)] = 1
         
         return grid
     
@@ -0,0 +1,98 @@
+import heapq
+import pygame
+
+class QuadTree:
+    def __init__(self, bounds, max_objects=10, max_levels=4, level=0):
+        """Initialize a quadtree node covering the given bounds rectangle."""
+        self.bounds = pygame.Rect(bounds)
+        self.max_objects = max_objects
+        self.max_levels = max_levels
+        self.level = level
+        self.objects = []  # (rect, item, insertion order)
+        self.nodes = []  # Four child nodes once split
+        self._count = 0
+
+    def clear(self):
+        """Remove all objects and child nodes."""
+        self.objects = []
+        self.nodes = []
+        self._count = 0
+
+    def split(self):
+        """Split the node into four equally sized child nodes."""
+        x, y = self.bounds.x, self.bounds.y
+        half_width = self.bounds.width // 2
+        half_height = self.bounds.height // 2
+        rest_width = self.bounds.width - half_width
+        rest_height = self.bounds.height - half_height
+        level = self.level + 1
+
+        self.nodes = [
+            QuadTree((x + half_width, y, rest_width, half_height), self.max_objects, self.max_levels, level),  # top-right
+            QuadTree((x, y, half_width, half_height), self.max_objects, self.max_levels, level),  # top-left
+            QuadTree((x, y + half_height, half_width, rest_height), self.max_objects, self.max_levels, level),  # bottom-left
+            QuadTree((x + half_width, y + half_height, rest_width, rest_height), self.max_objects, self.max_levels, level)  # bottom-right
+        ]
+
+    def get_index(self, rect):
+        """Get the child node that fully contains rect, or -1 if it straddles several."""
+        for index, node in enumerate(self.nodes):
+            if node.bounds.contains(rect):
+                return index
+        return -1
+
+    def insert(self, rect, item, _order=None):
+        """Insert an item with its bounding rectangle."""
+        if _order is None:
+            _order = self._count
+            self._count += 1
+
+        if self.nodes:
+            index = self.get_index(rect)
+            if index != -1:
+                self.nodes[index].insert(rect, item, _order)
+                return
+
+        self.objects.append((rect, item, _order))
+
+        # Push objects down once this node holds too many
+        if len(self.objects) > self.max_objects and self.level < self.max_levels:
+            if not self.nodes:
+                self.split()
+
+            remaining = []
+            for entry in self.objects:
+                index = self.get_index(entry[0])
+                if index != -1:
+                    self.nodes[index].insert(*entry)
+                else:
+                    remaining.append(entry)
+            self.objects = remaining
+
+    def nearest_iter(self, point):
+        """Yield items ordered by the distance from point to their rectangle center."""
+        px, py = point
+        # Best-first traversal: nodes are keyed by the squared distance from the
+        # point to their bounds, which never exceeds that of any object inside.
+        # Nodes sort before items at equal distance so ties keep insertion order.
+        heap = [(0, 0, 0, self)]
+        while heap:
+            d2, kind, order, entry = heapq.heappop(heap)
+            if kind == 1:
+                yield entry
+                continue
+
+            for rect, item, item_order in entry.objects:
+                dx = px - rect.centerx
+                dy = py - rect.centery
+                heapq.heappush(heap, (dx * dx + dy * dy, 1, item_order, item))
+
+            for node in entry.nodes:
+                bounds = node.bounds
+                dx = max(bounds.left - px, 0, px - bounds.right)
+                dy = max(bounds.top - py, 0, py - bounds.bottom)
+                heapq.heappush(heap, (dx * dx + dy * dy, 0, id(node), node))
+
+    def nearest(self, point):
+        """Get the item whose rectangle center is nearest to point, or None."""
+        return next(self.nearest_iter(point), None)
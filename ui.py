@@ -1,6 +1,33 @@
 import pygame
 
+_FONT_CACHE = {}  # SysFont per size
+_TEXT_CACHE = {}  # Rendered surface per (text, size, color)
+_TEXT_CACHE_LIMIT = 256
+
+def _get_font(size):
+    """Get the Arial font of the given size, loading it only once."""
+    font = _FONT_CACHE.get(size)
+    if font is None:
+        font = _FONT_CACHE[size] = pygame.font.SysFont('Arial', size)
+    return font
+
+def _render_text(text, size, color):
+    """Get the rendered surface for text, rendering it only once."""
+    key = (text, size, color)
+    text_surface = _TEXT_CACHE.get(key)
+    if text_surface is None:
+        # Status text changes over time, so keep the cache from growing without bound
+        if len(_TEXT_CACHE) >= _TEXT_CACHE_LIMIT:
+            _TEXT_CACHE.clear()
+        text_surface = _TEXT_CACHE[key] = _get_font(size).render(text, True, color)
+    return text_surface
+
 class Button:
+    @classmethod
+    def _font(cls):
+        """Get the button font, shared with draw_text through the font cache."""
+        return _get_font(20)
+    
     def __init__(self, x, y, width, height, text, color, hover_color):
         """Initialize a button with position, size, text, and colors."""
         self.rect = pygame.Rect(x, y, width, height)
@@ -8,7 +35,7 @@ class Button:
         self.color = color
         self.hover_color = hover_color
         self.current_color = color
-        self.font = pygame.font.SysFont('Arial', 20)
+        self.font = Button._font()
         self.text_surface = self.font.render(text, True, (255, 255, 255))
         self.text_rect = self.text_surface.get_rect(center=self.rect.center)
     
@@ -32,8 +59,7 @@ class Button:
 
 def draw_text(screen, text, position, size=24, color=(0, 0, 0)):
     """Draw text on the screen."""
-    font = pygame.font.SysFont('Arial', size)
-    text_surface = font.render(text, True, color)
+    text_surface = _render_text(text, size, tuple(color))
     text_rect = text_surface.get_rect()
     text_rect.topleft = position
     screen.blit(text_surface, text_rect)
@@ -1,5 +1,17 @@
 import math
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that leaves the function as plain Python."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
 def rotate_point(x, y, center_x, center_y, angle_deg):
     """Rotate a point around a center by an angle in degrees."""
     # Convert angle to radians
@@ -53,8 +65,11 @@ def line_intersects_rect(line_start, line_end, rect):
 
 def lines_intersect(line1_start, line1_end, line2_start, line2_end):
     """Check if two line segments intersect."""
-    def ccw(a, b, c):
-        return (c[1] - a[1]) * (b[0] - a[0]) > (b[1] - a[1]) * (c[0] - a[0])
+    x1, y1 = line1_start
+    x2, y2 = line1_end
+    x3, y3 = line2_start
+    x4, y4 = line2_end
     
-    return (ccw(line1_start, line2_start, line2_end) != ccw(line1_end, line2_start, line2_end) and
-            ccw(line1_start, line1_end, line2_start) != ccw(line1_start, line1_end, line2_end))
+    # Counter-clockwise orientation tests, written out inline
+    return (((y4 - y1) * (x3 - x1) > (y3 - y1) * (x4 - x1)) != ((y4 - y2) * (x3 - x2) > (y3 - y2) * (x4 - x2)) and
+            ((y3 - y1) * (x2 - x1) > (y2 - y1) * (x3 - x1)) != ((y4 - y1) * (x2 - x1) > (y2 - y1) * (x4 - x1)))
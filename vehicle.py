@@ -1,7 +1,74 @@
 import pygame
 import math
 import numpy as np
-from utils import rotate_point, distance, angle_between_points
+from utils import njit
+
+@njit(cache=True)
+def _obb_aabb_collide(cx, cy, cos_a, sin_a, half_length, half_width, ox0, oy0, ox1, oy1):
+    """Check collision between the rotated vehicle box and an axis-aligned rectangle using separating axes."""
+    # Obstacle center relative to the vehicle center, and obstacle half extents
+    half_x = (ox1 - ox0) / 2
+    half_y = (oy1 - oy0) / 2
+    dx = ox0 + half_x - cx
+    dy = oy0 + half_y - cy
+    abs_cos = abs(cos_a)
+    abs_sin = abs(sin_a)
+    
+    # World X and Y axes: the vehicle projects onto them as its bounding box
+    if abs(dx) > half_x + abs_cos * half_length + abs_sin * half_width:
+        return False
+    if abs(dy) > half_y + abs_sin * half_length + abs_cos * half_width:
+        return False
+    
+    # Vehicle length and width axes: the obstacle projects onto them as its rotated extents
+    if abs(dx * cos_a + dy * sin_a) > half_length + abs_cos * half_x + abs_sin * half_y:
+        return False
+    if abs(dy * cos_a - dx * sin_a) > half_width + abs_sin * half_x + abs_cos * half_y:
+        return False
+    
+    # No separating axis, so the boxes overlap
+    return True
+
+@njit(cache=True)
+def _seek_step(x, y, angle, velocity, target_x, target_y, turning_speed, max_velocity, acceleration, reach_radius):
+    """Steer and move one frame towards a target.
+    
+    Returns (x, y, angle, velocity, reached), where reached tells whether the
+    target was within reach_radius before moving.
+    """
+    # Calculate squared distance to target
+    dx = target_x - x
+    dy = target_y - y
+    reached = dx*dx + dy*dy < reach_radius * reach_radius
+    
+    # Calculate desired angle to target
+    desired_angle = math.degrees(math.atan2(dy, dx))
+    
+    # Adjust angle
+    angle_diff = (desired_angle - angle) % 360
+    if angle_diff > 180:
+        angle_diff -= 360
+    
+    # Rotate towards target
+    if abs(angle_diff) > 2:
+        if angle_diff > 0:
+            angle += min(turning_speed, angle_diff)
+        else:
+            angle -= min(turning_speed, -angle_diff)
+        # Normalize angle
+        angle %= 360
+        # Reduce speed when turning sharply
+        velocity = max(0.0, velocity - 0.05)
+    else:
+        # We're facing the right direction, accelerate
+        velocity = min(max_velocity, velocity + acceleration)
+    
+    # Move the vehicle
+    rad_angle = math.radians(angle)
+    x += velocity * math.cos(rad_angle)
+    y += velocity * math.sin(rad_angle)
+    
+    return x, y, angle, velocity, reached
 
 class Vehicle:
     def __init__(self, x, y, angle=0):
@@ -24,11 +91,40 @@ class Vehicle:
         self.length = 80
         self.color = (0, 0, 255)  # Blue car
         
+        # Body and front indicator outlines relative to the center, before rotation
+        half_length = self.length / 2
+        half_width = self.width / 2
+        indicator_size = 8
+        self._local_corners = np.array([
+            (-half_length, -half_width),  # top-left
+            (half_length, -half_width),   # top-right
+            (half_length, half_width),    # bottom-right
+            (-half_length, half_width)    # bottom-left
+        ], dtype=np.float32)
+        self._local_indicator = np.array([
+            (half_length, 0),
+            (half_length - indicator_size * math.cos(math.radians(30)), indicator_size * math.sin(math.radians(30))),
+            (half_length - indicator_size * math.cos(math.radians(30)), -indicator_size * math.sin(math.radians(30)))
+        ], dtype=np.float32)
+        
+        # Rotation matrix (transposed) for the last seen angle
+        self._cached_angle = None
+        self._rotation_t = np.identity(2)
+        
+        # World-space outlines, rewritten in place on every call
+        self._corner_buf = np.empty((4, 2))
+        self._indicator_buf = np.empty((3, 2))
+        
+        # Obstacle edges as an (N, 4) [left, top, right, bottom] array, rebuilt when the list changes
+        self._obstacle_source = None
+        self._obstacle_count = 0
+        self._obstacle_bounds = np.empty((0, 4), dtype=np.float32)
+        
         # Navigation
         self.target_x = None
         self.target_y = None
         self.target_angle = None
-        self.path = []
+        self.path = np.empty((0, 2), dtype=np.float32)  # Waypoints as (x, y) rows
         self.current_path_index = 0
         self.path_colors = [(0, 255, 0), (255, 165, 0), (128, 0, 128)]  # Green, Orange, Purple for different attempts
         
@@ -45,14 +141,14 @@ class Vehicle:
         self.target_x = None
         self.target_y = None
         self.target_angle = None
-        self.path = []
+        self.path = np.empty((0, 2), dtype=np.float32)
         self.current_path_index = 0
         self.state = "idle"
         self.parking_phase = 0
     
     def set_path(self, path, attempt_number):
         """Set a new path for the vehicle to follow."""
-        self.path = path
+        self.path = np.asarray(path, dtype=np.float32).reshape(-1, 2)
         self.current_path_index = 0
         self.path_color = self.path_colors[min(attempt_number - 1, len(self.path_colors) - 1)]
     
@@ -63,94 +159,61 @@ class Vehicle:
         self.target_angle = target_angle
         self.state = "moving"
     
+    def _get_rotation(self):
+        """Get the transposed rotation matrix [[cos, sin], [-sin, cos]] for the current angle."""
+        # Only recompute the rotation when the angle has changed
+        if self.angle != self._cached_angle:
+            rad_angle = math.radians(self.angle)
+            cos_a = math.cos(rad_angle)
+            sin_a = math.sin(rad_angle)
+            self._rotation_t = np.array([[cos_a, sin_a], [-sin_a, cos_a]])
+            self._cached_angle = self.angle
+        return self._rotation_t
+    
+    def _to_world(self, local_points, out):
+        """Rotate points given relative to the vehicle center and move them to its position, writing into out."""
+        np.matmul(local_points, self._get_rotation(), out=out)
+        out[:, 0] += self.x
+        out[:, 1] += self.y
+        return out
+    
     def get_corners(self):
-        """Get the four corners of the vehicle based on position and rotation."""
-        half_length = self.length / 2
-        half_width = self.width / 2
-        
-        # Define the four corners relative to center (before rotation)
-        corners = [
-            (-half_length, -half_width),  # top-left
-            (half_length, -half_width),   # top-right
-            (half_length, half_width),    # bottom-right
-            (-half_length, half_width)    # bottom-left
-        ]
-        
-        # Rotate and translate the corners
-        rotated_corners = []
-        for corner_x, corner_y in corners:
-            rx, ry = rotate_point(corner_x, corner_y, 0, 0, self.angle)
-            rotated_corners.append((self.x + rx, self.y + ry))
-        
-        return rotated_corners
+        """Get the four corners of the vehicle based on position and rotation (a reused buffer)."""
+        return self._to_world(self._local_corners, self._corner_buf)
+    
+    def _get_obstacle_bounds(self, obstacles):
+        """Get the obstacle edges array, rebuilding it if a different obstacle list is passed."""
+        if obstacles is not self._obstacle_source or len(obstacles) != self._obstacle_count:
+            self._obstacle_bounds = np.array(
+                [(obstacle.left, obstacle.top, obstacle.right, obstacle.bottom) for obstacle in obstacles],
+                dtype=np.float32
+            ).reshape(-1, 4)
+            self._obstacle_source = obstacles
+            self._obstacle_count = len(obstacles)
+        return self._obstacle_bounds
     
     def is_colliding(self, obstacles):
         """Check if the vehicle is colliding with any obstacles."""
-        vehicle_corners = self.get_corners()
-        vehicle_rect = pygame.Rect(0, 0, 0, 0)
-        vehicle_rect.points = vehicle_corners
+        cos_a, sin_a = self._get_rotation()[0].tolist()
+        x = float(self.x)
+        y = float(self.y)
+        half_length = self.length / 2
+        half_width = self.width / 2
         
-        for obstacle in obstacles:
-            # Simple rectangle collision
-            if self._check_rectangle_collision(vehicle_corners, obstacle):
+        # Broad phase: only obstacles overlapping the vehicle's bounding box can collide
+        extent_x = abs(cos_a) * half_length + abs(sin_a) * half_width
+        extent_y = abs(sin_a) * half_length + abs(cos_a) * half_width
+        bounds = self._get_obstacle_bounds(obstacles)
+        mask = ((bounds[:, 0] <= x + extent_x) & (bounds[:, 2] >= x - extent_x) &
+                (bounds[:, 1] <= y + extent_y) & (bounds[:, 3] >= y - extent_y))
+        
+        for left, top, right, bottom in bounds[mask].tolist():
+            # Oriented vehicle against axis-aligned obstacle
+            if _obb_aabb_collide(x, y, cos_a, sin_a, half_length, half_width, left, top, right, bottom):
                 return True
         
         return False
     
-    def _check_rectangle_collision(self, vehicle_corners, obstacle_rect):
-        """Check collision between the vehicle and a rectangle obstacle."""
-        # Convert pygame Rect to corners
-        obstacle_corners = [
-            (obstacle_rect.left, obstacle_rect.top),
-            (obstacle_rect.right, obstacle_rect.top),
-            (obstacle_rect.right, obstacle_rect.bottom),
-            (obstacle_rect.left, obstacle_rect.bottom)
-        ]
-        
-        # Check each edge of the vehicle against each edge of the obstacle
-        for i in range(4):
-            # Vehicle edge
-            v_edge_start = vehicle_corners[i]
-            v_edge_end = vehicle_corners[(i + 1) % 4]
-            
-            for j in range(4):
-                # Obstacle edge
-                o_edge_start = obstacle_corners[j]
-                o_edge_end = obstacle_corners[(j + 1) % 4]
-                
-                # Check if the two edges intersect
-                if self._do_lines_intersect(v_edge_start, v_edge_end, o_edge_start, o_edge_end):
-                    return True
-        
-        # Also check if one rectangle is completely inside the other
-        return self._is_point_in_polygon(vehicle_corners[0], obstacle_corners) or \
-               self._is_point_in_polygon(obstacle_corners[0], vehicle_corners)
-    
-    def _do_lines_intersect(self, p1, p2, p3, p4):
-        """Check if two line segments intersect."""
-        def ccw(a, b, c):
-            return (c[1]-a[1]) * (b[0]-a[0]) > (b[1]-a[1]) * (c[0]-a[0])
-        
-        return ccw(p1, p3, p4) != ccw(p2, p3, p4) and ccw(p1, p2, p3) != ccw(p1, p2, p4)
-    
-    def _is_point_in_polygon(self, point, polygon):
-        """Check if a point is inside a polygon using ray casting algorithm."""
-        x, y = point
-        n = len(polygon)
-        inside = False
-        
-        p1x, p1y = polygon[0]
-        for i in range(n + 1):
-            p2x, p2y = polygon[i % n]
-            if y > min(p1y, p2y) and y <= max(p1y, p2y) and x <= max(p1x, p2x):
-                if p1y != p2y:
-                    xinters = (y - p1y) * (p2x - p1x) / (p2y - p1y) + p1x
-                if p1x == p2x or x <= xinters:
-                    inside = not inside
-            p1x, p1y = p2x, p2y
-        
-        return inside
-    
     def update(self, obstacles=[]):
         """Update the vehicle's position and state."""
         if self.state == "idle":
@@ -171,41 +234,11 @@ class Vehicle:
             self.state = "idle"
             return
         
-        # Calculate distance to target
-        dx = self.target_x - self.x
-        dy = self.target_y - self.y
-        target_distance = math.sqrt(dx*dx + dy*dy)
-        
-        # Calculate desired angle to target
-        target_angle_rad = math.atan2(dy, dx)
-        desired_angle = math.degrees(target_angle_rad)
-        
-        # Adjust angle
-        angle_diff = (desired_angle - self.angle) % 360
-        if angle_diff > 180:
-            angle_diff -= 360
-        
-        # Rotate towards target
-        if abs(angle_diff) > 2:
-            if angle_diff > 0:
-                self.angle += min(self.turning_speed, angle_diff)
-            else:
-                self.angle -= min(self.turning_speed, -angle_diff)
-            # Normalize angle
-            self.angle %= 360
-            # Reduce speed when turning sharply
-            self.velocity = max(0, self.velocity - 0.05)
-        else:
-            # We're facing the right direction, accelerate
-            self.velocity = min(self.max_velocity, self.velocity + self.acceleration)
-        
-        # Move the vehicle
-        rad_angle = math.radians(self.angle)
-        self.x += self.velocity * math.cos(rad_angle)
-        self.y += self.velocity * math.sin(rad_angle)
+        # Move towards the target
+        reached = self._seek(self.target_x, self.target_y, self.max_velocity, self.acceleration, 5)
         
         # Check if we've reached the target
-        if target_distance < 5:
+        if reached:
             self.velocity = 0
             if self.target_angle is not None:
                 self.state = "rotating"
@@ -214,6 +247,15 @@ class Vehicle:
                 self.target_x = None
                 self.target_y = None
     
+    def _seek(self, target_x, target_y, max_velocity, acceleration, reach_radius):
+        """Steer and move one frame towards a target; return True if it was within reach_radius."""
+        self.x, self.y, self.angle, self.velocity, reached = _seek_step(
+            float(self.x), float(self.y), float(self.angle), float(self.velocity),
+            float(target_x), float(target_y), float(self.turning_speed),
+            float(max_velocity), float(acceleration), float(reach_radius)
+        )
+        return reached
+    
     def _update_rotating(self):
         """Update the vehicle when it's rotating to a target angle."""
         if self.target_angle is None:
@@ -253,45 +295,16 @@ class Vehicle:
             self.state = "returning"
             return
         
-        if self.path and self.current_path_index < len(self.path):
+        if self.current_path_index < len(self.path):
             # Follow the path
-            target = self.path[self.current_path_index]
-            
-            # Calculate distance to target
-            dx = target[0] - self.x
-            dy = target[1] - self.y
-            target_distance = math.sqrt(dx*dx + dy*dy)
+            target_x = self.path[self.current_path_index, 0]
+            target_y = self.path[self.current_path_index, 1]
             
-            # Calculate desired angle to target
-            target_angle_rad = math.atan2(dy, dx)
-            desired_angle = math.degrees(target_angle_rad)
-            
-            # Adjust angle
-            angle_diff = (desired_angle - self.angle) % 360
-            if angle_diff > 180:
-                angle_diff -= 360
-            
-            # Rotate towards target
-            if abs(angle_diff) > 2:
-                if angle_diff > 0:
-                    self.angle += min(self.turning_speed, angle_diff)
-                else:
-                    self.angle -= min(self.turning_speed, -angle_diff)
-                # Normalize angle
-                self.angle %= 360
-                # Reduce speed when turning sharply
-                self.velocity = max(0, self.velocity - 0.05)
-            else:
-                # We're facing the right direction, accelerate
-                self.velocity = min(self.max_velocity / 2, self.velocity + self.acceleration / 2)
-            
-            # Move the vehicle
-            rad_angle = math.radians(self.angle)
-            self.x += self.velocity * math.cos(rad_angle)
-            self.y += self.velocity * math.sin(rad_angle)
+            # Move towards the waypoint at half speed
+            reached = self._seek(target_x, target_y, self.max_velocity / 2, self.acceleration / 2, 5)
             
             # Check if we've reached the target
-            if target_distance < 5:
+            if reached:
                 self.current_path_index += 1
                 if self.current_path_index >= len(self.path):
                     self.state = "idle"
@@ -305,9 +318,9 @@ class Vehicle:
         # Move back to starting position
         dx = self.start_x - self.x
         dy = self.start_y - self.y
-        distance_to_start = math.sqrt(dx*dx + dy*dy)
+        distance_to_start_sq = dx*dx + dy*dy
         
-        if distance_to_start < 10:
+        if distance_to_start_sq < 10 * 10:
             # We're close enough to the start
             self.x = self.start_x
             self.y = self.start_y
@@ -332,33 +345,8 @@ class Vehicle:
             # Normalize angle
             self.angle %= 360
         else:
-            # Calculate desired angle to start
-            target_angle_rad = math.atan2(dy, dx)
-            desired_angle = math.degrees(target_angle_rad)
-            
-            # Adjust angle
-            angle_diff = (desired_angle - self.angle) % 360
-            if angle_diff > 180:
-                angle_diff -= 360
-            
-            # Rotate towards target
-            if abs(angle_diff) > 2:
-                if angle_diff > 0:
-                    self.angle += min(self.turning_speed, angle_diff)
-                else:
-                    self.angle -= min(self.turning_speed, -angle_diff)
-                # Normalize angle
-                self.angle %= 360
-                # Reduce speed when turning sharply
-                self.velocity = max(0, self.velocity - 0.05)
-            else:
-                # We're facing the right direction, accelerate
-                self.velocity = min(self.max_velocity, self.velocity + self.acceleration)
-            
-            # Move the vehicle
-            rad_angle = math.radians(self.angle)
-            self.x += self.velocity * math.cos(rad_angle)
-            self.y += self.velocity * math.sin(rad_angle)
+            # Move towards the start position
+            self._seek(self.start_x, self.start_y, self.max_velocity, self.acceleration, 0)
     
     def draw(self, screen):
         """Draw the vehicle on the screen."""
@@ -367,27 +355,15 @@ class Vehicle:
         pygame.draw.polygon(screen, self.color, corners)
         
         # Draw a small triangle to indicate the front of the vehicle
-        front_x = self.x + (self.length / 2) * math.cos(math.radians(self.angle))
-        front_y = self.y + (self.length / 2) * math.sin(math.radians(self.angle))
-        
-        # Draw front indicator
-        indicator_size = 8
-        indicator_points = [
-            (front_x, front_y),
-            (front_x - indicator_size * math.cos(math.radians(self.angle - 30)), 
-             front_y - indicator_size * math.sin(math.radians(self.angle - 30))),
-            (front_x - indicator_size * math.cos(math.radians(self.angle + 30)), 
-             front_y - indicator_size * math.sin(math.radians(self.angle + 30)))
-        ]
+        indicator_points = self._to_world(self._local_indicator, self._indicator_buf)
         pygame.draw.polygon(screen, (255, 255, 0), indicator_points)  # Yellow triangle
         
         # Draw the path with appropriate color
         if len(self.path) > 1:
-            for i in range(len(self.path) - 1):
-                pygame.draw.line(screen, self.path_color, 
-                                self.path[i], self.path[i + 1], 2)
+            points = self.path.tolist()
+            pygame.draw.lines(screen, self.path_color, False, points, 2)
             
             # Draw current target point with a different color
-            if self.current_path_index < len(self.path):
+            if self.current_path_index < len(points):
                 pygame.draw.circle(screen, (255, 0, 0), 
-                                  self.path[self.current_path_index], 5)
+                                  points[self.current_path_index], 5)